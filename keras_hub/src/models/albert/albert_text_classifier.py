@@ -97,9 +97,8 @@ class AlbertTextClassifier(TextClassifier):
     labels = [0, 3]
 
     bytes_io = io.BytesIO()
-    ds = tf.data.Dataset.from_tensor_slices(features)
     sentencepiece.SentencePieceTrainer.train(
-        sentence_iterator=ds.as_numpy_iterator(),
+        sentence_iterator=iter(features),
         model_writer=bytes_io,
         vocab_size=10,
         model_type="WORD",
@@ -169,7 +168,10 @@ class AlbertTextClassifier(TextClassifier):
         # === Functional Model ===
         inputs = backbone.input
         pooled = backbone(inputs)["pooled_output"]
-        pooled = self.output_dropout(pooled)
+        # Skip the dropout op entirely when no dropout is requested, so the
+        # head lowers to a single dense op.
+        if dropout:
+            pooled = self.output_dropout(pooled)
         outputs = self.output_dense(pooled)
         super().__init__(
             inputs=inputs,
@@ -43,6 +43,11 @@ class BertTextClassifier(TextClassifier):
             Defaults to `None`.
         dropout: float. The dropout probability value, applied after the dense
             layer.
+        head_dtype: `None`, str, or `keras.mixed_precision.DTypePolicy`. The
+            dtype to use for the classification head's computations and
+            weights. Defaults to the backbone's dtype policy. When running the
+            backbone with a mixed precision policy, pass `"float32"` to keep
+            the output logits and loss numerically stable.
 
     Examples:
 
@@ -89,6 +94,22 @@ class BertTextClassifier(TextClassifier):
     classifier.fit(x=features, y=labels, batch_size=2)
     ```
 
+    Quantized deployment.
+    ```python
+    classifier = keras_hub.models.BertTextClassifier.from_preset(
+        "bert_base_en_uncased",
+        num_classes=4,
+    )
+    # Quantize weights in place to int8.
+    classifier.quantize("int8")
+    # Or export a dynamic range quantized LiteRT (TFLite) flatbuffer.
+    classifier.export(
+        "model.tflite",
+        format="litert",
+        optimizations=[tf.lite.Optimize.DEFAULT],
+    )
+    ```
+
     Custom backbone and vocabulary.
     ```python
     features = ["The quick brown fox jumped.", "I forgot my homework."]
@@ -130,28 +151,34 @@ class BertTextClassifier(TextClassifier):
         preprocessor=None,
         activation=None,
         dropout=0.1,
+        head_dtype=None,
         **kwargs,
     ):
+        head_dtype = head_dtype or backbone.dtype_policy
+
         # === Layers ===
         self.backbone = backbone
         self.preprocessor = preprocessor
         self.output_dropout = keras.layers.Dropout(
             dropout,
-            dtype=backbone.dtype_policy,
+            dtype=head_dtype,
             name="classifier_dropout",
         )
         self.output_dense = keras.layers.Dense(
             num_classes,
             kernel_initializer=bert_kernel_initializer(),
             activation=activation,
-            dtype=backbone.dtype_policy,
+            dtype=head_dtype,
             name="logits",
         )
 
         # === Functional Model ===
         inputs = backbone.input
         pooled = backbone(inputs)["pooled_output"]
-        pooled = self.output_dropout(pooled)
+        # Skip the dropout op entirely when no dropout is requested, so the
+        # head lowers to a single dense op.
+        if dropout:
+            pooled = self.output_dropout(pooled)
         outputs = self.output_dense(pooled)
         super().__init__(
             inputs=inputs,
@@ -10,14 +10,25 @@ from keras_hub.src.tests.test_case import TestCase
 
 
 class BertTextClassifierTest(TestCase):
-    def setUp(self):
-        # Setup model.
-        self.vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
-        self.vocab += ["the", "quick", "brown", "fox", "."]
-        self.preprocessor = BertTextClassifierPreprocessor(
-            BertTokenizer(vocabulary=self.vocab),
+    @classmethod
+    def setUpClass(cls):
+        # The preprocessor and test data hold no trainable state, so build
+        # them once for all test methods.
+        super().setUpClass()
+        cls.vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+        cls.vocab += ["the", "quick", "brown", "fox", "."]
+        cls.preprocessor = BertTextClassifierPreprocessor(
+            BertTokenizer(vocabulary=cls.vocab),
             sequence_length=5,
         )
+        cls.train_data = (
+            ["the quick brown fox.", "the slow brown fox."],  # Features.
+            [1, 0],  # Labels.
+        )
+        cls.input_data = cls.preprocessor(*cls.train_data)[0]
+
+    def setUp(self):
+        # Setup model.
         self.backbone = BertBackbone(
             vocabulary_size=self.preprocessor.tokenizer.vocabulary_size(),
             num_layers=2,
@@ -31,11 +42,6 @@ class BertTextClassifierTest(TestCase):
             "backbone": self.backbone,
             "num_classes": 2,
         }
-        self.train_data = (
-            ["the quick brown fox.", "the slow brown fox."],  # Features.
-            [1, 0],  # Labels.
-        )
-        self.input_data = self.preprocessor(*self.train_data)[0]
 
     def test_classifier_basics(self):
         self.run_task_test(
@@ -45,6 +51,11 @@ class BertTextClassifierTest(TestCase):
             expected_output_shape=(2, 2),
         )
 
+    def test_head_dtype(self):
+        model = BertTextClassifier(**self.init_kwargs, head_dtype="bfloat16")
+        self.assertEqual(model.output_dense.compute_dtype, "bfloat16")
+        self.assertEqual(self.backbone.compute_dtype, "float32")
+
     @pytest.mark.large
     def test_saved_model(self):
         self.run_model_saving_test(
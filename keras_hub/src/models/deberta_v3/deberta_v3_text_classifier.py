@@ -104,9 +104,8 @@ class DebertaV3TextClassifier(TextClassifier):
     labels = [0, 3]
 
     bytes_io = io.BytesIO()
-    ds = tf.data.Dataset.from_tensor_slices(features)
     sentencepiece.SentencePieceTrainer.train(
-        sentence_iterator=ds.as_numpy_iterator(),
+        sentence_iterator=iter(features),
         model_writer=bytes_io,
         vocab_size=10,
         model_type="WORD",
@@ -187,9 +186,13 @@ class DebertaV3TextClassifier(TextClassifier):
         # === Functional Model ===
         inputs = backbone.input
         x = backbone(inputs)[:, backbone.start_token_index, :]
-        x = self.pooled_dropout(x)
+        # Skip the dropout ops entirely when no dropout is requested, which
+        # is the default graph for this model.
+        if dropout:
+            x = self.pooled_dropout(x)
         x = self.pooled_dense(x)
-        x = self.output_dropout(x)
+        if dropout:
+            x = self.output_dropout(x)
         outputs = self.output_dense(x)
         super().__init__(
             inputs=inputs,
@@ -82,9 +82,8 @@ class DebertaV3TextClassifierPreprocessor(TextClassifierPreprocessor):
 
     # Custom vocabulary.
     bytes_io = io.BytesIO()
-    ds = tf.data.Dataset.from_tensor_slices(["The quick brown fox jumped."])
     sentencepiece.SentencePieceTrainer.train(
-        sentence_iterator=ds.as_numpy_iterator(),
+        sentence_iterator=iter(["The quick brown fox jumped."]),
         model_writer=bytes_io,
         vocab_size=9,
         model_type="WORD",
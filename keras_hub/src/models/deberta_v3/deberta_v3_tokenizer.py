@@ -61,9 +61,8 @@ class DebertaV3Tokenizer(SentencePieceTokenizer):
 
     # Custom vocabulary.
     bytes_io = io.BytesIO()
-    ds = tf.data.Dataset.from_tensor_slices(["The quick brown fox jumped."])
     sentencepiece.SentencePieceTrainer.train(
-        sentence_iterator=ds.as_numpy_iterator(),
+        sentence_iterator=iter(["The quick brown fox jumped."]),
         model_writer=bytes_io,
         vocab_size=9,
         model_type="WORD",
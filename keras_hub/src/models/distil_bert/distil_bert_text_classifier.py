@@ -171,7 +171,10 @@ class DistilBertTextClassifier(TextClassifier):
         inputs = backbone.input
         x = backbone(inputs)[:, backbone.cls_token_index, :]
         x = self.pooled_dense(x)
-        x = self.output_dropout(x)
+        # Skip the dropout op entirely when no dropout is requested, which
+        # is the default graph for this model.
+        if dropout:
+            x = self.output_dropout(x)
         outputs = self.output_dense(x)
         super().__init__(
             inputs=inputs,
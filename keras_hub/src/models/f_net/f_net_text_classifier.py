@@ -121,7 +121,10 @@ class FNetTextClassifier(TextClassifier):
         # === Functional Model ===
         inputs = backbone.input
         pooled = backbone(inputs)["pooled_output"]
-        pooled = self.output_dropout(pooled)
+        # Skip the dropout op entirely when no dropout is requested, so the
+        # head lowers to a single dense op.
+        if dropout:
+            pooled = self.output_dropout(pooled)
         outputs = self.output_dense(pooled)
         super().__init__(
             inputs=inputs,
@@ -12,17 +12,28 @@ from keras_hub.src.tests.test_case import TestCase
 
 
 class FNetTextClassifierTest(TestCase):
-    def setUp(self):
-        # Setup model.
-        self.preprocessor = FNetTextClassifierPreprocessor(
+    @classmethod
+    def setUpClass(cls):
+        # The preprocessor and test data hold no trainable state, so build
+        # them once for all test methods.
+        super().setUpClass()
+        cls.preprocessor = FNetTextClassifierPreprocessor(
             FNetTokenizer(
                 # Generated using create_f_net_test_proto.py
                 proto=os.path.join(
-                    self.get_test_data_dir(), "f_net_test_vocab.spm"
+                    cls.get_test_data_dir(), "f_net_test_vocab.spm"
                 )
             ),
             sequence_length=5,
         )
+        cls.train_data = (
+            ["the quick brown fox.", "the slow brown fox."],  # Features.
+            [1, 0],  # Labels.
+        )
+        cls.input_data = cls.preprocessor(*cls.train_data)[0]
+
+    def setUp(self):
+        # Setup model.
         self.backbone = FNetBackbone(
             vocabulary_size=self.preprocessor.tokenizer.vocabulary_size(),
             num_layers=2,
@@ -35,11 +46,6 @@ class FNetTextClassifierTest(TestCase):
             "backbone": self.backbone,
             "num_classes": 2,
         }
-        self.train_data = (
-            ["the quick brown fox.", "the slow brown fox."],  # Features.
-            [1, 0],  # Labels.
-        )
-        self.input_data = self.preprocessor(*self.train_data)[0]
 
     def test_classifier_basics(self):
         self.run_task_test(
@@ -47,9 +47,8 @@ class GemmaTokenizer(SentencePieceTokenizer):
 
     # Custom vocabulary.
     bytes_io = io.BytesIO()
-    ds = tf.data.Dataset.from_tensor_slices(["The quick brown fox jumped."])
     sentencepiece.SentencePieceTrainer.train(
-        sentence_iterator=ds.as_numpy_iterator(),
+        sentence_iterator=iter(["The quick brown fox jumped."]),
         model_writer=bytes_io,
         vocab_size=8,
         model_type="WORD",
@@ -170,9 +170,13 @@ class RobertaTextClassifier(TextClassifier):
         # === Functional Model ===
         inputs = backbone.input
         x = backbone(inputs)[:, backbone.start_token_index, :]
-        x = self.pooled_dropout(x)
+        # Skip the dropout ops entirely when no dropout is requested, which
+        # is the default graph for this model.
+        if dropout:
+            x = self.pooled_dropout(x)
         x = self.pooled_dense(x)
-        x = self.output_dropout(x)
+        if dropout:
+            x = self.output_dropout(x)
         outputs = self.output_dense(x)
         super().__init__(
             inputs=inputs,
@@ -41,6 +41,9 @@ class Task(PipelineModel):
         compile: boolean, defaults to `True`. If `True` will compile the model
             with default parameters on construction. Model can still be
             recompiled with a new loss, optimizer and metrics before training.
+            Pass `False` for inference-only usage; this skips building the
+            default optimizer, whose slot variables can take several times the
+            backbone's weight memory once allocated.
     """
 
     backbone_cls = None
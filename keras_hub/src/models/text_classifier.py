@@ -56,6 +56,7 @@ class TextClassifier(Task):
         loss="auto",
         *,
         metrics="auto",
+        jit_compile="auto",
         **kwargs,
     ):
         """Configures the `TextClassifier` task for training.
@@ -82,6 +83,12 @@ class TextClassifier(Task):
                 applied to track the accuracy of the model during training.
                 See `keras.Model.compile` and `keras.metrics` for
                 more info on possible `metrics` values.
+            jit_compile: Bool or `"auto"`. Whether to compile the model with
+                XLA. Defaults to `"auto"`, which lets Keras pick based on the
+                backend and available devices. Because classifier inputs are
+                padded to a fixed sequence length, the compiled graph is
+                shape-stable, and passing `jit_compile=True` is safe and
+                usually faster even in settings where `"auto"` declines XLA.
             **kwargs: See `keras.Model.compile` for a full list of arguments
                 supported by the compile method.
         """
@@ -98,5 +105,6 @@ class TextClassifier(Task):
             optimizer=optimizer,
             loss=loss,
             metrics=metrics,
+            jit_compile=jit_compile,
             **kwargs,
         )
@@ -99,10 +99,10 @@ class XLMRobertaTextClassifier(TextClassifier):
     features = ["The quick brown fox jumped.", "نسيت الواجب"]
     labels = [0, 3]
 
-    def train_sentencepiece(ds, vocab_size):
+    def train_sentencepiece(sentences, vocab_size):
         bytes_io = io.BytesIO()
         sentencepiece.SentencePieceTrainer.train(
-            sentence_iterator=ds.as_numpy_iterator(),
+            sentence_iterator=iter(sentences),
             model_writer=bytes_io,
             vocab_size=vocab_size,
             model_type="WORD",
@@ -111,10 +111,10 @@ class XLMRobertaTextClassifier(TextClassifier):
             eos_id=2,
         )
         return bytes_io.getvalue()
-    ds = tf.data.Dataset.from_tensor_slices(
-        ["the quick brown fox", "the earth is round"]
+    proto = train_sentencepiece(
+        ["the quick brown fox", "the earth is round"],
+        vocab_size=10,
     )
-    proto = train_sentencepiece(ds, vocab_size=10)
     tokenizer = keras_hub.models.XLMRobertaTokenizer(
         proto=proto
     )
@@ -183,9 +183,13 @@ class XLMRobertaTextClassifier(TextClassifier):
         # === Functional Model ===
         inputs = backbone.input
         x = backbone(inputs)[:, backbone.start_token_index, :]
-        x = self.pooled_dropout(x)
+        # Skip the dropout ops entirely when no dropout is requested, which
+        # is the default graph for this model.
+        if dropout:
+            x = self.pooled_dropout(x)
         x = self.pooled_dense(x)
-        x = self.output_dropout(x)
+        if dropout:
+            x = self.output_dropout(x)
         outputs = self.output_dense(x)
         # Instantiate using Functional API Model constructor
         super().__init__(
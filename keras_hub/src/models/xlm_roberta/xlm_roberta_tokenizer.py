@@ -61,10 +61,10 @@ class XLMRobertaTokenizer(SentencePieceTokenizer):
     tokenizer.detokenize(tokenizer("the quick brown fox"))
 
     # Custom vocabulary
-    def train_sentencepiece(ds, vocab_size):
+    def train_sentencepiece(sentences, vocab_size):
         bytes_io = io.BytesIO()
         sentencepiece.SentencePieceTrainer.train(
-            sentence_iterator=ds.as_numpy_iterator(),
+            sentence_iterator=iter(sentences),
             model_writer=bytes_io,
             vocab_size=vocab_size,
             model_type="WORD",
@@ -74,10 +74,10 @@ class XLMRobertaTokenizer(SentencePieceTokenizer):
         )
         return bytes_io.getvalue()
 
-    ds = tf.data.Dataset.from_tensor_slices(
-        ["the quick brown fox", "the earth is round"]
+    proto = train_sentencepiece(
+        ["the quick brown fox", "the earth is round"],
+        vocab_size=10,
     )
-    proto = train_sentencepiece(ds, vocab_size=10)
     tokenizer = keras_hub.models.XLMRobertaTokenizer(proto=proto)
     ```
     """
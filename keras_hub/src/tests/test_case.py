@@ -1023,6 +1023,9 @@ class TestCase(tf.test.TestCase, parameterized.TestCase):
         self.run_serialization_test(task)
         preprocessor = task.preprocessor
         ds = tf.data.Dataset.from_tensor_slices(train_data).batch(batch_size)
+        # Preprocess once and cache, so the split preprocessing checks below
+        # do not re-tokenize the same batch on every pass.
+        preprocessed_ds = ds.map(preprocessor).cache()
         x, y, sw = keras.utils.unpack_x_y_sample_weight(train_data)
 
         # Test: the tree struct output by the
@@ -1044,7 +1047,7 @@ class TestCase(tf.test.TestCase, parameterized.TestCase):
         self.assertAllClose(output, output_ds)
         # With split preprocessing.
         task.preprocessor = None
-        output_split = task.predict(ds.map(preprocessor))
+        output_split = task.predict(preprocessed_ds)
         task.preprocessor = preprocessor
         self.assertAllClose(output, output_split)
 
@@ -1054,7 +1057,7 @@ class TestCase(tf.test.TestCase, parameterized.TestCase):
         task.fit(ds)
         # With split preprocessing.
         task.preprocessor = None
-        task.fit(ds.map(preprocessor))
+        task.fit(preprocessed_ds)
         task.preprocessor = preprocessor
         # Turn off default compilation, should error during `fit()`.
         task = cls(**init_kwargs, compile=False)
@@ -1112,7 +1115,8 @@ class TestCase(tf.test.TestCase, parameterized.TestCase):
             output = ops.argmax(output, axis=-1)
             self.assertAllEqual(output, expected_labels)
 
-    def get_test_data_dir(self):
+    @classmethod
+    def get_test_data_dir(cls):
         return str(pathlib.Path(__file__).parent / "test_data")
 
     def load_test_image(self, target_size=None):
@@ -60,38 +60,38 @@ class SentencePieceTokenizer(tokenizer.Tokenizer):
 
     From bytes.
     ```python
-    def train_sentence_piece_bytes(ds, size):
+    def train_sentence_piece_bytes(sentences, size):
         bytes_io = io.BytesIO()
         sentencepiece.SentencePieceTrainer.train(
-            sentence_iterator=ds.as_numpy_iterator(),
+            sentence_iterator=iter(sentences),
             model_writer=bytes_io,
             vocab_size=size,
         )
         return bytes_io.getvalue()
 
     # Train a sentencepiece proto.
-    ds = tf.data.Dataset.from_tensor_slices(["the quick brown fox."])
-    proto = train_sentence_piece_bytes(ds, 20)
+    proto = train_sentence_piece_bytes(["the quick brown fox."], 20)
     # Tokenize inputs.
     tokenizer = keras_hub.tokenizers.SentencePieceTokenizer(proto=proto)
+    ds = tf.data.Dataset.from_tensor_slices(["the quick brown fox."])
     ds = ds.map(tokenizer)
     ```
 
     From a file.
     ```python
-    def train_sentence_piece_file(ds, path, size):
+    def train_sentence_piece_file(sentences, path, size):
         with open(path, "wb") as model_file:
             sentencepiece.SentencePieceTrainer.train(
-                sentence_iterator=ds.as_numpy_iterator(),
+                sentence_iterator=iter(sentences),
                 model_writer=model_file,
                 vocab_size=size,
             )
 
     # Train a sentencepiece proto.
-    ds = tf.data.Dataset.from_tensor_slices(["the quick brown fox."])
-    proto = train_sentence_piece_file(ds, "model.spm", 20)
+    train_sentence_piece_file(["the quick brown fox."], "model.spm", 20)
     # Tokenize inputs.
     tokenizer = keras_hub.tokenizers.SentencePieceTokenizer(proto="model.spm")
+    ds = tf.data.Dataset.from_tensor_slices(["the quick brown fox."])
     ds = ds.map(tokenizer)
     ```
     """
@@ -5,6 +5,7 @@ import inspect
 import json
 import os
 import re
+import types
 
 import keras
 from absl import logging
@@ -64,6 +65,10 @@ SAFETENSOR_FILE = "model.safetensors"
 # Global state for preset registry.
 BUILTIN_PRESETS = {}
 BUILTIN_PRESETS_FOR_BACKBONE = collections.defaultdict(dict)
+# Cache of merged preset mappings, so repeated `presets` accesses do not
+# re-walk the subclass registry. Keyed on the class and the registry sizes,
+# so new preset or class registrations invalidate stale entries.
+BUILTIN_PRESETS_CACHE = {}
 
 
 def register_presets(presets, backbone_cls):
@@ -73,21 +78,28 @@ def register_presets(presets, backbone_cls):
     library itself.
     """
     for preset in presets:
-        BUILTIN_PRESETS[preset] = presets[preset]
-        BUILTIN_PRESETS_FOR_BACKBONE[backbone_cls][preset] = presets[preset]
+        # Preset metadata is read-only after registration. Freeze each entry
+        # so it can be handed out by `presets` lookups without copying.
+        metadata = types.MappingProxyType(presets[preset])
+        BUILTIN_PRESETS[preset] = metadata
+        BUILTIN_PRESETS_FOR_BACKBONE[backbone_cls][preset] = metadata
 
 
 def builtin_presets(cls):
     """Find all registered built-in presets for a class."""
-    presets = {}
-    if cls in BUILTIN_PRESETS_FOR_BACKBONE:
-        presets.update(BUILTIN_PRESETS_FOR_BACKBONE[cls])
-    backbone_cls = getattr(cls, "backbone_cls", None)
-    if backbone_cls:
-        presets.update(builtin_presets(backbone_cls))
-    for subclass in list_subclasses(cls):
-        presets.update(builtin_presets(subclass))
-    return presets
+    key = (cls, len(BUILTIN_PRESETS), len(keras.saving.get_custom_objects()))
+    if key not in BUILTIN_PRESETS_CACHE:
+        presets = {}
+        if cls in BUILTIN_PRESETS_FOR_BACKBONE:
+            presets.update(BUILTIN_PRESETS_FOR_BACKBONE[cls])
+        backbone_cls = getattr(cls, "backbone_cls", None)
+        if backbone_cls:
+            presets.update(builtin_presets(backbone_cls))
+        for subclass in list_subclasses(cls):
+            presets.update(builtin_presets(subclass))
+        BUILTIN_PRESETS_CACHE[key] = presets
+    # Return a copy so callers cannot mutate the cached mapping.
+    return dict(BUILTIN_PRESETS_CACHE[key])
 
 
 def list_subclasses(cls):